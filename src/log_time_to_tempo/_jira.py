@@ -1,15 +1,18 @@
 """Wrapper around [JIRA Python API](https://jira.readthedocs.io/)."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-
-from jira import JIRA
+from typing import TYPE_CHECKING
 
 from . import caching as c
 from ._time import modified_within
 
+if TYPE_CHECKING:
+    from jira import JIRA
+
 
 @c.cache('issues-$project')
-def get_issues(client: JIRA, *, project='TSI', **kwargs):
+def get_issues(client: 'JIRA', *, project='TSI', **kwargs):
     return {
         i.key: i.fields.summary
         for i in sorted(
@@ -20,30 +23,33 @@ def get_issues(client: JIRA, *, project='TSI', **kwargs):
 
 
 @c.cache('issues')
-def get_all_issues(client: JIRA, **kwargs):
+def get_all_issues(client: 'JIRA', **kwargs):
+    # issues are requested per project, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        issues_per_project = executor.map(
+            lambda project: get_issues(client, project=project, **kwargs),
+            get_projects(client, **kwargs),
+        )
     rv = {}
-    for project in get_projects(client, **kwargs):
-        rv.update(get_issues(client, project=project, **kwargs))
+    for issues in issues_per_project:
+        rv.update(issues)
     return rv
 
 
 @c.cache('projects')
-def get_projects(client: JIRA, **kwargs):
+def get_projects(client: 'JIRA', **kwargs):
     return {p.key: p.name for p in sorted(client.projects(), key=lambda p: p.key)}
 
 
-@c.cache('myself')
-def myself(client: JIRA, **kwargs):
+# the user doesn't change for a given token, so the result never expires
+@c.cache('myself-$token_hash', days=None)
+def myself(client: 'JIRA', token_hash: str = '', **kwargs):
     return client.myself()
 
 
 def cache_is_warm():
     issue_list = c.cache_dir / 'issues'
-    return (
-        c.cache_dir.is_dir()
-        and issue_list in c.cache_dir.iterdir()
-        and modified_within(issue_list, weeks=1)
-    )
+    return issue_list.is_file() and modified_within(issue_list, weeks=1)
 
 
 # before `init`, caches are not initialized and no client is available during completion
@@ -1,10 +1,10 @@
 import re
 from datetime import date, datetime, time, timedelta
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 from calendar import MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY  # isort: skip (keep weekdays in order)
-import dateparser
 
 
 def parse_duration(s: str) -> timedelta:
@@ -57,6 +57,8 @@ def parse_date(value: str | date) -> date:
         try:
             return parse_past_weekday_relative(value)
         except ValueError:
+            import dateparser  # slow to import and rarely needed
+
             return dateparser.parse(value).date()
 
 
@@ -158,6 +160,7 @@ relative_date_range_abbreviations = {
 }
 
 
+@lru_cache(maxsize=32)
 def resolve_relative_date_range(v: str) -> RelativeDateRange:
     if any(v in syn for syn in relative_date_range_abbreviations.values()):
         v = next(k for k, syn in relative_date_range_abbreviations.items() if v in syn)
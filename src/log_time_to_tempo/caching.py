@@ -1,5 +1,6 @@
 import inspect
 import pickle
+import re
 from functools import wraps
 from pathlib import Path
 from string import Template
@@ -13,40 +14,49 @@ _registry = {}
 
 
 def cache(filename='', days=7):
+    """Cache results of the decorated function to a file in `cache_dir`.
+
+    `filename` may reference arguments of the decorated function (e.g. `issues-$project`).
+    `days` is the maximum age of a cached result. It can also be a callable, which
+    receives the arguments of the call and returns the maximum age (or None to never expire).
+    """
+
     def caching_decorator(func):
         @wraps(func)
         def wrapped_function(*args, **kwargs):
-            if func not in _registry:
-                _registry[func] = set()
+            _registry.setdefault(func, set())
             filename2 = func.__name__ if not filename else filename
             if kwargs.get('no_cache', False):
                 return func(*args, **kwargs)
             spec = inspect.getfullargspec(func)
-            default_args = (
-                {k: v for k, v in zip(reversed(spec.args), spec.defaults)}
-                if spec.defaults is not None
-                else {}
-            )
-            given_args = {k: v for k, v in zip(reversed(spec.args), args)}
+            defaults = spec.defaults or ()
+            arguments = {
+                **dict(zip(spec.args[len(spec.args) - len(defaults) :], defaults)),
+                **(spec.kwonlydefaults or {}),
+                **dict(zip(spec.args, args)),
+                **kwargs,
+            }
             filename3 = (
-                Template(filename2).safe_substitute(
-                    _get_args_dict(func, args, {**default_args, **given_args, **kwargs})
-                )
-                if '$' in filename2
-                else filename2
+                Template(filename2).safe_substitute(arguments) if '$' in filename2 else filename2
             )
+            max_age = days(arguments) if callable(days) else days
             if not cache_dir.is_dir():
                 cache_dir.mkdir(parents=True, exist_ok=True)
             fp = cache_dir / filename3
             if fp not in _registry[func]:
                 _registry[func].add(fp)
-            if fp.exists() and not kwargs.get('update_cache') and modified_within(fp, days=days):
+            if (
+                fp.exists()
+                and not kwargs.get('update_cache')
+                and (max_age is None or modified_within(fp, days=max_age))
+            ):
                 return pickle.load(fp.open('rb'))
             rv = func(*args, **kwargs)
             if not kwargs.get('no_update_cache'):
                 pickle.dump(rv, fp.open('wb'))
             return rv
 
+        wrapped_function.cache_filename = filename or func.__name__
         return wrapped_function
 
     return caching_decorator
@@ -60,14 +70,21 @@ def invalidate(fn=None):
         return
     for fp in get_caches_for(fn):
         fp.unlink(missing_ok=True)
-    del _registry[inspect.unwrap(fn)]
+    _registry.pop(inspect.unwrap(fn), None)
+
+
+def invalidate_matching(fn):
+    """Delete every cached result of `fn`, including results cached by previous processes.
+
+    Cache files are matched by the filename template of `fn` (e.g. `issues-$project` matches
+    `issues-*`).
+    """
+    pattern = re.sub(r'\$(\w+|\{\w+\})', '*', fn.cache_filename)
+    for fp in cache_dir.glob(pattern):
+        fp.unlink(missing_ok=True)
+    _registry.pop(inspect.unwrap(fn), None)
 
 
 def get_caches_for(fn) -> set[Path]:
     fn = inspect.unwrap(fn)
     return _registry.get(fn, {})
-
-
-def _get_args_dict(fn, args, kwargs):
-    args_names = fn.__code__.co_varnames[: fn.__code__.co_argcount]
-    return {**dict(zip(args_names, args)), **kwargs}
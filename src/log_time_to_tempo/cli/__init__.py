@@ -1,3 +1,4 @@
+import os
 import pathlib
 import typing as t
 
@@ -9,6 +10,9 @@ from .. import name
 app_dir = pathlib.Path(click.get_app_dir(name))
 app = typer.Typer(no_args_is_help=True, rich_markup_mode='rich')
 
+# set by click, when the shell requests completions for one of our entry points
+completion_envvars = (f'_{name.upper()}_COMPLETE', '_LOG_TIME_COMPLETE')
+
 
 def link(uri, label=None):
     if label is None:
@@ -21,6 +25,11 @@ def link(uri, label=None):
     return escape_mask.format(parameters, uri, label)
 
 
+def is_completing() -> bool:
+    """Check whether the CLI is running to provide shell completions."""
+    return any(var in os.environ for var in completion_envvars)
+
+
 def error(message, terminate=True, code=1):
     typer.secho(message, fg=typer.colors.RED)
     if terminate:
@@ -1,35 +1,71 @@
 import json
+from functools import lru_cache
 from typing import Annotated
 
-import rich
 import typer
 from click.shell_completion import CompletionItem
-from rich.table import Table
-from simple_term_menu import TerminalMenu
 from typer import Context
 
 from .. import _jira
 from . import app, app_dir
+from .completions import _mock_client
 
 fp_project_aliases = app_dir / 'aliases'
 
 
+@lru_cache(maxsize=1)
+def _read_aliases_cached(mtime_ns: int) -> dict:
+    if mtime_ns:
+        return json.loads(fp_project_aliases.read_text())
+    return {}
+
+
+@lru_cache(maxsize=1)
+def _issues_by_alias_cached(mtime_ns: int) -> dict:
+    # if multiple issues share an alias, the first one takes precedence
+    return {
+        issue_alias: issue
+        for issue, issue_alias in reversed(_read_aliases_cached(mtime_ns).items())
+    }
+
+
+def _aliases_mtime_ns() -> int:
+    return fp_project_aliases.stat().st_mtime_ns if fp_project_aliases.exists() else 0
+
+
+def get_aliases() -> dict:
+    """Return aliases for read-only use.
+
+    Aliases are cached until the alias file is modified. Use `_read_aliases` to obtain a copy
+    that may be modified.
+    """
+    return _read_aliases_cached(_aliases_mtime_ns())
+
+
+def get_issues_by_alias() -> dict:
+    """Return mapping of alias to issue key for read-only use (reverse of `get_aliases`)."""
+    return _issues_by_alias_cached(_aliases_mtime_ns())
+
+
+def invalidate_aliases():
+    _read_aliases_cached.cache_clear()
+    _issues_by_alias_cached.cache_clear()
+
+
 def _read_aliases() -> dict:
-    aliases = {}
-    if fp_project_aliases.exists():
-        aliases = json.load(fp_project_aliases.open())
-    return aliases
+    return dict(get_aliases())
 
 
 def _write_aliases(aliases):
-    json.dump(aliases, fp_project_aliases.open('w'), indent=2)
+    fp_project_aliases.write_text(json.dumps(aliases, indent=2))
+    invalidate_aliases()
 
 
 def complete_issue_aliased(ctx: Context, param: str, incomplete: str) -> list[CompletionItem]:
     if ctx.params.get('unset'):
         issues = _read_aliases()
     else:
-        issues = _jira.get_all_issues(client=_jira.MockClient(), no_update_cache=True)
+        issues = _jira.get_all_issues(client=_mock_client, no_update_cache=True)
     return [CompletionItem(key, help=description) for key, description in issues.items()]
 
 
@@ -48,12 +84,17 @@ def alias(
         return
     aliases = _read_aliases()
     if not issue:
+        import rich
+        from rich.table import Table
+
         grid = Table(padding=(0, 1))
         grid.add_column('Alias', justify='right', style='cyan')
         grid.add_column('Issues', justify='left')
-        alias_values = sorted(set(aliases.values()))
-        for alias in alias_values:
-            grid.add_row(alias, '\n'.join(k for k, v in aliases.items() if v == alias))
+        issues_per_alias = {}
+        for issue_key, issue_alias in aliases.items():
+            issues_per_alias.setdefault(issue_alias, []).append(issue_key)
+        for issue_alias in sorted(issues_per_alias):
+            grid.add_row(issue_alias, '\n'.join(issues_per_alias[issue_alias]))
         rich.print(grid)
         return
     if issue in aliases:
@@ -71,6 +112,8 @@ def alias_unset(
 ):
     aliases = _read_aliases()
     if issue_or_alias is None:
+        from simple_term_menu import TerminalMenu
+
         KEY, VALUE = 0, 1
         menu_items = [
             (f'[{idx}]{item[KEY]} ({item[VALUE]})', item[KEY])
@@ -87,9 +130,9 @@ def alias_unset(
     else:
         if issue_or_alias in aliases.keys():
             issue = issue_or_alias
-        elif issue_or_alias in aliases.values():
-            issue = next(k for k, v in aliases.items() if v == issue_or_alias)
         else:
+            issue = get_issues_by_alias().get(issue_or_alias)
+        if issue is None:
             typer.secho(f'Unknown issue or alias: {issue_or_alias}', color='yellow')
             exit(1)
     if force or typer.confirm(f"Delete alias '{aliases[issue]}' for {issue}?"):
@@ -1,22 +1,62 @@
+from itertools import chain
+
 from click.shell_completion import CompletionItem
 
-from .. import _jira
+from .. import _jira, _time
+
+max_completions = 50
+
+# provides default completions, while caches have not been initialized
+_mock_client = _jira.MockClient()
+
+
+_date_range_completions = tuple(
+    CompletionItem(
+        v,
+        help=f'short: {", ".join(sorted(_time.relative_date_range_abbreviations[v]))}'
+        if v in _time.relative_date_range_abbreviations
+        else '',
+    )
+    for v in _time.RelativeDateRange._value2member_map_.keys()
+)
 
 
-def complete_project(ctx, param: str, incomplete: str) -> list[str]:
-    return [
-        CompletionItem(value=project_key, help=project_name)
-        for project_key, project_name in _jira.get_projects(
-            client=_jira.MockClient(), no_update_cache=True
-        ).items()
-        if project_key.startswith(incomplete) or project_name.lower().startswith(incomplete)
-    ]
+def _complete(kind: str, incomplete: str) -> list[CompletionItem]:
+    """Complete keys matching `incomplete` by key or description (case-insensitive).
+
+    Key matches are suggested before description matches.
+    """
+    load = _jira.get_projects if kind == 'projects' else _jira.get_all_issues
+    items = load(client=_mock_client, no_update_cache=True)
+    incomplete = incomplete.casefold()
+    matches = chain(
+        (key for key in items if key.casefold().startswith(incomplete)),
+        (
+            key
+            for key, description in items.items()
+            if description.casefold().startswith(incomplete)
+        ),
+    )
+    seen = set()
+    completions = []
+    for key in matches:
+        if key in seen:
+            continue
+        seen.add(key)
+        completions.append(CompletionItem(key, help=items[key]))
+        if len(completions) == max_completions:
+            break
+    return completions
+
+
+def complete_project(ctx, param: str, incomplete: str) -> list[CompletionItem]:
+    return _complete('projects', incomplete)
 
 
 def complete_issue(ctx, param: str, incomplete: str) -> list[CompletionItem]:
-    return [
-        CompletionItem(key, help=description)
-        for key, description in _jira.get_all_issues(
-            client=_jira.MockClient(), no_update_cache=True
-        ).items()
-    ]
+    return _complete('issues', incomplete)
+
+
+def complete_date_range(ctx, param: str, incomplete: str) -> list[CompletionItem]:
+    incomplete = incomplete.casefold()
+    return [c for c in _date_range_completions if c.value.startswith(incomplete)]
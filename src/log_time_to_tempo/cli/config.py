@@ -1,9 +1,10 @@
+import os
 import pathlib
 from enum import StrEnum, auto
+from functools import lru_cache
 from typing import Annotated
 
 import dotenv
-import rich
 import typer
 from dotenv import dotenv_values, find_dotenv, load_dotenv
 
@@ -39,10 +40,35 @@ def load_local_config():
 
 
 def find_local_config() -> pathlib.Path | None:
-    if cfg := find_dotenv(filename, usecwd=True):
+    if cfg := _find_local_config_cached(os.getcwd()):
         return pathlib.Path(cfg)
 
 
+@lru_cache(maxsize=8)
+def _find_local_config_cached(cwd: str) -> str:
+    return find_dotenv(filename, usecwd=True)
+
+
+@lru_cache(maxsize=32)
+def _dotenv_values_cached(path: str, mtime_ns: int) -> dict:
+    return dotenv_values(path)
+
+
+def _dotenv_values(fp: str | pathlib.Path) -> dict:
+    """Parse configuration file, reusing previous results while the file is unchanged."""
+    try:
+        mtime_ns = os.stat(fp).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _dotenv_values_cached(str(fp), mtime_ns)
+
+
+def _invalidate_caches():
+    """Forget cached configuration files after they have been modified."""
+    _find_local_config_cached.cache_clear()
+    _dotenv_values_cached.cache_clear()
+
+
 def load():
     """Find and load closest local config (if it exists) and system config.
 
@@ -90,6 +116,8 @@ def config(
     ] = False,
 ):
     "Interact with configuration."
+    import rich
+
     # Determine which configuration files to interact with
     config_files = []
     fp_closest_local_config = find_local_config()
@@ -110,16 +138,18 @@ def config(
         if value is not None:
             fp = config_files[0]
             dotenv.set_key(fp, key, value)
+            _invalidate_caches()
             return
         if unset:
             for fp in config_files:
-                if key in dotenv_values(fp):
+                if key in _dotenv_values(fp):
                     log.info('Unsetting %s from "%s"', key, fp)
                     dotenv.unset_key(fp, key)
+                    _invalidate_caches()
                     return
         else:
             for fp in config_files:
-                if key in (final_config := dotenv_values(fp)):
+                if key in (final_config := _dotenv_values(fp)):
                     rich.print(final_config[key])
                     return
 
@@ -128,7 +158,7 @@ def config(
         final_config = {}
         for fp in config_files:
             if fp.exists():
-                this_config = dotenv_values(fp)
+                this_config = _dotenv_values(fp)
                 if unset:
                     if not force:
                         rich.print_json(data=this_config)
@@ -136,6 +166,7 @@ def config(
                         f'Do you want to delete configuration at "{link(fp)}"?'
                     ):
                         fp.unlink()
+                        _invalidate_caches()
                         typer.echo('Config reset.')
                 # keep precedence of local over system config
                 final_config = {**this_config, **final_config}
@@ -151,6 +182,6 @@ def load_full_config(config_files: list[str | pathlib.Path] = None):
         config_files = [fp_config_default, find_local_config()]
     full_config = {}
     for fp in config_files:
-        if fp.exists():
-            full_config.update(dotenv_values(fp))
+        if fp is not None:
+            full_config.update(_dotenv_values(fp))
     return full_config
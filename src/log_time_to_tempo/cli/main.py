@@ -1,39 +1,61 @@
+import hashlib
 import os
 import platform
 import shutil
+import sys
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
-from typing import Optional
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter, itemgetter
+from typing import Iterable, Optional
 
-import jira
-import keyring
-import keyring.backends.macOS
-import rich
 import typer
-from click.shell_completion import CompletionItem
-from keyring.errors import PasswordDeleteError
-from rich.table import Table
 from typing_extensions import Annotated
 
-from .. import __version__, _jira, _time, caching, cfg, name, tempo
+from .. import __version__, _jira, _time, caching, cfg, name
 from .._logging import log
-from . import alias, app, config, error, link
-from .completions import complete_issue, complete_project
+from . import alias, app, config, error, is_completing, link
+from .completions import complete_date_range, complete_issue, complete_project
 
-token_found_in_environment = os.getenv('JIRA_API_TOKEN')
-config.load()
+# configuration must be loaded before click resolves environment variables of `main`
+# options, but completions don't depend on it
+if not is_completing():
+    config.load()
+
+# subcommands that require an authenticated jira client
+_jira_subcommands = frozenset({'log', 'issues', 'list', 'projects', 'init', 'stats', '*'})
+# subcommands that benefit from warm caches (e.g. for completing issues); `issues` and `projects`
+# populate the caches they need themselves, while `list` and `stats` don't use them
+_warm_cache_subcommands = frozenset({'log'})
 
 arg_relative_date_range = typer.Argument(
-    callback=lambda x: _time.resolve_relative_date_range(x),
-    shell_complete=lambda ctx, param, incomplete: list(
-        CompletionItem(
-            v,
-            help=f'short: {", ".join(_time.relative_date_range_abbreviations.get(v))}'
-            if v in _time.relative_date_range_abbreviations
-            else '',
-        )
-        for v in _time.RelativeDateRange._value2member_map_.keys()
-    ),
+    callback=_time.resolve_relative_date_range, shell_complete=complete_date_range
+)
+opt_limit = typer.Option(
+    '--limit', '-n', min=0, help='Show at most this many entries', show_envvar=False
+)
+opt_parallel = typer.Option(
+    '--parallel', '-j', help='Number of months to fetch concurrently', show_envvar=False
 )
+opt_refresh = typer.Option(
+    '--refresh', help='Fetch worklogs again, even if they are cached', show_envvar=False
+)
+
+
+@lru_cache(maxsize=4)
+def _cached_keyring_get(service: str, username: str) -> str | None:
+    import keyring
+
+    return keyring.get_password(service, username)
+
+
+def _print_version_and_exit(value: bool):
+    if value:
+        typer.echo(__version__)
+        raise typer.Exit()
 
 
 @app.callback(
@@ -60,7 +82,10 @@ def main(
     persist_token: Annotated[bool, typer.Option(hidden=True)] = True,
     cache: Annotated[bool, typer.Option(hidden=True)] = True,
     version: Annotated[
-        bool, typer.Option('--version', callback=lambda v: print(__version__) if v else None)
+        bool,
+        typer.Option(
+            '--version', callback=_print_version_and_exit, is_eager=True, expose_value=False
+        ),
     ] = False,
 ):
     """Log time to tempo."""
@@ -80,17 +105,21 @@ def main(
 
         coloredlogs.install(**log_config)
     ctx.obj.verbose = verbose
-    ctx.obj.aliases = alias._read_aliases()
 
     # return early for subcommands that don't interact with jira
-    if ctx.invoked_subcommand not in 'log issues list projects init stats *'.split():
+    if ctx.invoked_subcommand not in _jira_subcommands:
         return
 
+    import jira
+    import keyring
+
     if token is None:
         if platform.system() == 'Darwin':
+            import keyring.backends.macOS
+
             keyring.set_keyring(keyring.backends.macOS.Keyring())
         if 'JIRA_USER' in os.environ and (
-            token := keyring.get_password(name, os.environ['JIRA_USER'])
+            token := _cached_keyring_get(name, os.environ['JIRA_USER'])
         ):
             log.debug('Token read from keyring')
             persist_token = False
@@ -113,19 +142,23 @@ def main(
 
     cfg.instance = instance
     try:
-        cfg.myself = _jira.myself(cfg.jira)
-        ctx.invoke(config.config, key='JIRA_USER', value=cfg.myself['name'])
+        cfg.myself = _jira.myself(
+            cfg.jira, token_hash=hashlib.blake2b(token.encode()).hexdigest()[:16]
+        )
+        if os.getenv('JIRA_USER') != cfg.myself['name']:
+            ctx.invoke(config.config, key='JIRA_USER', value=cfg.myself['name'])
     except jira.JIRAError as e:
         error(f'Could not authenticate: {e}')
 
     cfg.token = token
 
-    if persist_token:
+    if persist_token and _cached_keyring_get(name, cfg.myself['name']) != token:
         log.info("Saved token for '%s' to keyring.", cfg.myself['name'])
         keyring.set_password(name, cfg.myself['name'], token)
+        _cached_keyring_get.cache_clear()
 
     cfg.cache = cache
-    if not _jira.cache_is_warm() and ctx.invoked_subcommand != 'init' and cache:
+    if ctx.invoked_subcommand in _warm_cache_subcommands and cache and not _jira.cache_is_warm():
         ctx.invoke(init, ctx=ctx, cache=cache)
     log.debug('user: %s', cfg.myself['name'])
 
@@ -141,7 +174,7 @@ def log_time(
     ] = 'TSI-7',
     day: Annotated[
         date, typer.Option(parser=_time.parse_date, show_envvar=False, show_default='today')
-    ] = datetime.now().date(),
+    ] = None,
     start: Annotated[time, typer.Option(parser=_time.parse_time, show_default='9')] = None,
     end: Annotated[time, typer.Option(parser=_time.parse_time)] = None,
     lunch: Annotated[timedelta, typer.Option(parser=_time.parse_duration)] = None,
@@ -151,16 +184,23 @@ def log_time(
     "Log time entry."
     if ctx.resilient_parsing:  # script is running for completion purposes
         return
+    import rich
+    from rich.text import Text
+
+    from .. import tempo
+
     cfg = ctx.obj
+    if day is None:
+        day = date.today()
 
-    if issue in ctx.obj.aliases.values():
-        issue = next(k for k, v in ctx.obj.aliases.items() if v == issue)
+    issue = alias.get_issues_by_alias().get(issue, issue)
 
     cfg.issue = cfg.jira.issue(issue, fields='summary,comment')
     description = get_project_description(ctx, cfg.issue)
 
-    worklogs = tempo.get_worklogs(ctx.obj.myself['key'], day, day)
-    seconds_logged = sum(worklog.timeSpentSeconds for worklog in worklogs)
+    # the start of the new worklog depends on the latest state, so don't use cached worklogs
+    worklogs = tempo.get_worklogs(ctx.obj.myself['key'], day, day, no_cache=True)
+    seconds_logged = sum(map(attrgetter('timeSpentSeconds'), worklogs))
     duration_logged = timedelta(seconds=seconds_logged)
     if worklogs and start is None:
         last_worklog = worklogs[-1]
@@ -176,12 +216,13 @@ def log_time(
         duration -= lunch
         end = (datetime.combine(day, end) - lunch).time()
 
+    # assemble styled text directly, so issue summaries are not parsed as markup
     rich.print(
-        'Log',
-        _time.format_duration(duration),
-        f'({start.strftime("%H:%M")} - {end.strftime("%H:%M")})',
-        f'as [italic]{cfg.issue.fields.summary} ({description})[/italic]',
-        f'for {_time.format_date_relative(day)}',
+        Text.assemble(
+            f'Log {_time.format_duration(duration)} ({start:%H:%M} - {end:%H:%M}) as ',
+            (f'{cfg.issue.fields.summary} ({description})', 'italic'),
+            f' for {_time.format_date_relative(day)}',
+        )
     )
 
     if duration_logged + duration > timedelta(hours=10):
@@ -208,7 +249,9 @@ def cmd_list(
     from_date: Annotated[date, typer.Option('--from', parser=_time.parse_date)] = None,
     to_date: Annotated[
         date, typer.Option('--to', parser=_time.parse_date, show_default='today')
-    ] = datetime.now().date().strftime('%d.%m'),
+    ] = None,
+    parallel: Annotated[int, opt_parallel] = 8,
+    refresh: Annotated[bool, opt_refresh] = False,
 ):
     """List time entries.
 
@@ -216,16 +259,53 @@ def cmd_list(
 
     $ lt list --from 1.12 --to 24.12
     """
+    from .. import tempo
+
+    if to_date is None:
+        to_date = date.today()
     if from_date is None:
         from_date, to_date = _time.parse_relative_date_range(date_range)
-    for worklog in tempo.get_worklogs(ctx.obj.myself['key'], from_date, to_date):
-        typer.echo(
-            f'{worklog.started.strftime("%d.%m %H:%M")}  {
+    project_description = _memoized_project_description(ctx)
+    worklogs = tempo.get_worklogs(
+        ctx.obj.myself['key'],
+        from_date,
+        to_date,
+        parallel=parallel,
+        no_cache=not ctx.obj.cache,
+        update_cache=refresh,
+    )
+    # output all worklogs at once instead of writing each line separately
+    lines = []
+    for worklog in worklogs:
+        started = worklog.started
+        lines.append(
+            f'{started.day:02d}.{started.month:02d} {started.hour:02d}:{started.minute:02d}  {
                 _time.format_duration_aligned(timedelta(seconds=worklog.timeSpentSeconds), 2)
-            }  {get_project_description(ctx, worklog.issue)} ({worklog.issue.key}) - {
-                worklog.comment
-            }'
+            }  {project_description(worklog.issue)} ({worklog.issue.key}) - {worklog.comment}'
         )
+    if lines:
+        typer.echo('\n'.join(lines))
+
+
+@dataclass(slots=True)
+class DailyStats:
+    """Time spent on a project during a single day."""
+
+    seconds: int
+    # most days have a single comment, so a set is only created for differing comments
+    comments: str | set[str]
+
+    def add(self, seconds: int, comment: str):
+        self.seconds += seconds
+        if isinstance(self.comments, set):
+            self.comments.add(comment)
+        elif comment != self.comments:
+            self.comments = {self.comments, comment}
+
+    def format_comments(self) -> str:
+        if isinstance(self.comments, set):
+            return ', '.join(sorted(self.comments))
+        return self.comments
 
 
 @app.command('stats', rich_help_panel='GET')
@@ -235,8 +315,10 @@ def cmd_stats(
     from_date: Annotated[Optional[date], typer.Option('--from', parser=_time.parse_date)] = None,
     to_date: Annotated[
         date, typer.Option('--to', parser=_time.parse_date, show_default='today')
-    ] = datetime.now().date().strftime('%d.%m'),
+    ] = None,
     verbose: Annotated[int, typer.Option('-v', count=True)] = 0,
+    parallel: Annotated[int, opt_parallel] = 8,
+    refresh: Annotated[bool, opt_refresh] = False,
 ):
     """Show logged time per project.
 
@@ -244,6 +326,10 @@ def cmd_stats(
 
     $ lt list --from 1.12 --to 24.12
     """
+    from .. import tempo
+
+    if to_date is None:
+        to_date = date.today()
     if from_date is None:
         typer.secho(f'Period: {date_range.value}', bold=True)
         try:
@@ -257,28 +343,31 @@ def cmd_stats(
             bold=True,
         )
 
-    stats = {}
-    for worklog in tempo.get_worklogs(ctx.obj.myself['key'], from_date, to_date):
-        project = get_project_description(ctx, worklog.issue)
-        if project not in stats:
-            stats[project] = {
-                'timeSpentSeconds': 0,
-                'summary': worklog.issue.summary,
-                'worklogs': [],
-                'days': {},
-            }
-        stats[project]['timeSpentSeconds'] = (
-            stats[project]['timeSpentSeconds'] + worklog.timeSpentSeconds
-        )
-        stats[project]['worklogs'].append(worklog)
-        if (date := worklog.started.strftime('%d.%m')) not in stats[project]['days']:
-            stats[project]['days'][date] = {
-                'comments': set([worklog.comment]),
-                'timeSpentSeconds': worklog.timeSpentSeconds,
-            }
+    stats = defaultdict(
+        lambda: {'timeSpentSeconds': 0, 'summary': None, 'worklogs': [], 'days': {}}
+    )
+    project_description = _memoized_project_description(ctx)
+    for worklog in tempo.get_worklogs(
+        ctx.obj.myself['key'],
+        from_date,
+        to_date,
+        parallel=parallel,
+        no_cache=not ctx.obj.cache,
+        update_cache=refresh,
+    ):
+        project_stats = stats[project_description(worklog.issue)]
+        if project_stats['summary'] is None:
+            project_stats['summary'] = worklog.issue.summary
+        seconds = worklog.timeSpentSeconds
+        project_stats['timeSpentSeconds'] += seconds
+        project_stats['worklogs'].append(worklog)
+        started = worklog.started
+        day = f'{started.day:02d}.{started.month:02d}'
+        days = project_stats['days']
+        if (daily_stats := days.get(day)) is None:
+            days[day] = DailyStats(seconds, worklog.comment)
         else:
-            stats[project]['days'][date]['comments'].add(worklog.comment)
-            stats[project]['days'][date]['timeSpentSeconds'] += worklog.timeSpentSeconds
+            daily_stats.add(seconds, worklog.comment)
 
     for project in sorted(stats, key=lambda k: stats[k]['timeSpentSeconds'], reverse=True):
         total_duration = _time.format_duration_aligned(
@@ -286,26 +375,54 @@ def cmd_stats(
         )
         typer.echo(f'{typer.style(total_duration, bold=True)}  {project}')
         if ctx.obj.verbose > 0 or verbose > 0:
-            for date, daily_stats in stats[project]['days'].items():
-                timeSpent = _time.format_duration_aligned(
-                    timedelta(seconds=daily_stats['timeSpentSeconds'])
-                )
-                typer.echo(f'          {date}: {timeSpent} - , '.join(daily_stats['comments']))
+            for day, daily_stats in stats[project]['days'].items():
+                timeSpent = _time.format_duration_aligned(timedelta(seconds=daily_stats.seconds))
+                typer.echo(f'          {day}: {timeSpent} - {daily_stats.format_comments()}')
     typer.secho('-' * 20)
     total_duration = _time.format_duration_aligned(
-        timedelta(seconds=sum(project['timeSpentSeconds'] for project in stats.values()))
+        timedelta(seconds=sum(map(itemgetter('timeSpentSeconds'), stats.values())))
     )
     typer.secho(f'{total_duration}  Total', bold=True)
 
 
+def _remove_dir_in_background(path) -> threading.Thread | None:
+    """Move directory out of the way and delete its contents in a background thread.
+
+    Leftovers of previous runs, which exited before deletion was completed, are deleted as well.
+    """
+    trash = list(path.parent.glob(f'{path.name}.deleted-*'))
+    target = path.with_name(f'{path.name}.deleted-{os.getpid()}')
+    try:
+        os.replace(path, target)
+        trash.append(target)
+    except FileNotFoundError:
+        pass
+    except OSError:  # e.g. directory is in use on Windows
+        shutil.rmtree(path, ignore_errors=True)
+    if not trash:
+        return None
+
+    def remove_trash():
+        for fp in trash:
+            shutil.rmtree(fp, ignore_errors=True)
+
+    # not a daemon thread, so deletion is completed before the interpreter exits
+    thread = threading.Thread(target=remove_trash)
+    thread.start()
+    return thread
+
+
 @app.command(rich_help_panel='GET')
 def issues(
     ctx: typer.Context,
     project: Annotated[
         str, typer.Argument(envvar='JIRA_PROJECT', shell_complete=complete_project)
     ] = '*',
+    limit: Annotated[Optional[int], opt_limit] = None,
 ):
     "List issues"
+    import jira
+
     try:
         if project == '*':
             issues = _jira.get_all_issues(ctx.obj.jira)
@@ -313,26 +430,35 @@ def issues(
             issues = _jira.get_issues(ctx.obj.jira, project=project)
     except jira.JIRAError as e:
         error(e.text)
-    grid = Table(padding=(0, 1))
-    grid.add_column('Key', justify='right', style='cyan')
-    grid.add_column('Issue', justify='left')
-    for key, summary in issues.items():
-        grid.add_row(key, summary)
-    rich.print(grid)
+    _print_grid('Issue', islice(issues.items(), limit))
 
 
 @app.command(rich_help_panel='GET')
-def projects(ctx: typer.Context):
+def projects(ctx: typer.Context, limit: Annotated[Optional[int], opt_limit] = None):
     "List projects."
+    import jira
+
     try:
         projects = _jira.get_projects(ctx.obj.jira, no_cache=not ctx.obj.cache)
     except jira.JIRAError as e:
         error(e.text)
+    _print_grid('Project', islice(projects.items(), limit))
+
+
+def _print_grid(title: str, rows: Iterable[tuple[str, str]]):
+    """Print keys and their title as table or, when output is piped, as tab-separated lines."""
+    if not sys.stdout.isatty():
+        if lines := [f'{key}\t{value}' for key, value in rows]:
+            typer.echo('\n'.join(lines))
+        return
+    import rich
+    from rich.table import Table
 
     grid = Table(padding=(0, 1))
     grid.add_column('Key', justify='right', style='cyan')
-    grid.add_column('Project', justify='left')
-    [grid.add_row(*p) for p in projects.items()]
+    grid.add_column(title, justify='left')
+    for key, value in rows:
+        grid.add_row(key, value)
     rich.print(grid)
 
 
@@ -351,13 +477,17 @@ def reset(
     ] = False,
 ):
     "Clear local cache and configuration values."
+    import keyring
+    from keyring.errors import PasswordDeleteError
+
     if force or typer.confirm('Delete cache?'):
-        shutil.rmtree(caching.cache_dir, ignore_errors=True)
+        _remove_dir_in_background(caching.cache_dir)
         typer.echo('Cache reset.')
     if force or typer.confirm('Delete API token from keyring?'):
         try:
+            _cached_keyring_get.cache_clear()
             keyring.delete_password(name, os.environ['JIRA_USER'])
-            caching.invalidate(_jira.myself)
+            caching.invalidate_matching(_jira.myself)
             typer.echo('Token removed from keyring.')
         except PasswordDeleteError:
             log.info('No token in keyring to delete')
@@ -395,12 +525,26 @@ def debug(ctx: typer.Context):
 
 
 def get_project_description(ctx, issue):
-    if alias := ctx.obj.aliases.get(issue.key):
-        return alias
+    import jira
+
+    if issue_alias := alias.get_aliases().get(issue.key):
+        return issue_alias
     if isinstance(issue, jira.Issue):
         return issue.key
     return issue.summary
 
 
+def _memoized_project_description(ctx):
+    """Return `get_project_description` for `ctx`, memoized by issue key."""
+    descriptions = {}
+
+    def project_description(issue):
+        if (description := descriptions.get(issue.key)) is None:
+            description = descriptions[issue.key] = get_project_description(ctx, issue)
+        return description
+
+    return project_description
+
+
 if __name__ == '__main__':
     app()
@@ -1,9 +1,11 @@
-from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Iterator
 
 import requests
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from log_time_to_tempo import cfg
+from log_time_to_tempo import caching, cfg
 
 from ._logging import log
 
@@ -28,7 +30,42 @@ class Worklog(BaseModel):
     dateCreated: str
 
 
-def get_worklogs(worker_id: str, from_date: date, to_date: date):
+_worklogs = TypeAdapter(list[Worklog])
+
+
+def _worklogs_max_age(arguments: dict) -> float | None:
+    # worklogs of past periods are final (unless logged via `lt log`, which clears the cache),
+    # while worklogs of the current period may still be changed elsewhere
+    return None if arguments['to_date'] < date.today() else 5 / (24 * 60)
+
+
+@caching.cache('worklogs-$worker_id-$from_date-$to_date', days=_worklogs_max_age)
+def get_worklogs(worker_id: str, from_date: date, to_date: date, *, parallel: int = 1, **kwargs):
+    """Return worklogs of `worker_id` between `from_date` and `to_date` (inclusive).
+
+    With `parallel > 1`, longer date ranges are split into calendar months, which are
+    requested concurrently using up to `parallel` threads.
+    """
+
+    periods = list(_split_by_month(from_date, to_date)) if parallel > 1 else []
+    if len(periods) <= 1:
+        return _search_worklogs(worker_id, from_date, to_date)
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        worklogs_per_period = executor.map(
+            lambda period: _search_worklogs(worker_id, *period), periods
+        )
+    return [worklog for worklogs in worklogs_per_period for worklog in worklogs]
+
+
+def _split_by_month(from_date: date, to_date: date) -> Iterator[tuple[date, date]]:
+    """Yield consecutive (from, to) periods covering the date range, one per calendar month."""
+    while from_date <= to_date:
+        next_month = (from_date.replace(day=28) + timedelta(days=4)).replace(day=1)
+        yield from_date, min(to_date, next_month - timedelta(days=1))
+        from_date = next_month
+
+
+def _search_worklogs(worker_id: str, from_date: date, to_date: date) -> list[Worklog]:
     payload = {
         'worker': [worker_id],
         'from': from_date.isoformat(),
@@ -36,7 +73,7 @@ def get_worklogs(worker_id: str, from_date: date, to_date: date):
     }
     response = _post('search', json=payload)
     log.debug(response.text)
-    return [Worklog(**item) for item in response.json()]
+    return _worklogs.validate_json(response.content)
 
 
 def create_worklog(
@@ -58,6 +95,8 @@ def create_worklog(
 
     response = _post(json=payload)
     log.debug(response.text)
+    # cached worklogs of any period containing the new worklog are outdated now
+    caching.invalidate_matching(get_worklogs)
 
 
 def _post(endpoint: str = '', **kwargs):
@@ -22,6 +22,7 @@ def cli(caplog, tmp_path, monkeypatch):
     monkeypatch.setattr('log_time_to_tempo.cli.app_dir', tmp_path / 'lt')
     monkeypatch.setattr('log_time_to_tempo.caching.cache_dir', tmp_path / 'lt' / 'cache')
     monkeypatch.setattr('log_time_to_tempo.cli.config.fp_config_default', tmp_path / '.lt')
+    monkeypatch.setattr('log_time_to_tempo.cli.alias.fp_project_aliases', tmp_path / 'aliases')
 
     def invoke(*args, **kwargs) -> Result:
         runner: CliRunner = CliRunner(mix_stderr=False)
@@ -0,0 +1,33 @@
+import pytest
+
+import log_time_to_tempo.cli.alias as alias
+
+
+@pytest.fixture
+def fp_aliases(monkeypatch, tmp_path):
+    fp_aliases = tmp_path / 'aliases'
+    monkeypatch.setattr('log_time_to_tempo.cli.alias.fp_project_aliases', fp_aliases)
+    alias.invalidate_aliases()
+    yield fp_aliases
+    alias.invalidate_aliases()
+
+
+def test_read_write_aliases(fp_aliases):
+    assert alias.get_aliases() == {}, 'no aliases should exist without alias file'
+
+    alias._write_aliases({'TEST-1': 'foo'})
+    assert alias.get_aliases() == {'TEST-1': 'foo'}, 'writing should invalidate cached aliases'
+
+    aliases = alias._read_aliases()
+    aliases['TEST-2'] = 'bar'
+    assert alias.get_aliases() == {'TEST-1': 'foo'}, 'modifying a copy should not affect cache'
+
+
+def test_issues_by_alias(fp_aliases):
+    alias._write_aliases({'TEST-1': 'foo', 'TEST-2': 'bar', 'TEST-3': 'foo'})
+    assert alias.get_issues_by_alias() == {'foo': 'TEST-1', 'bar': 'TEST-2'}, (
+        'first issue should take precedence for a shared alias'
+    )
+
+    alias._write_aliases({'TEST-2': 'bar'})
+    assert alias.get_issues_by_alias() == {'bar': 'TEST-2'}, 'writing should invalidate cache'
@@ -28,3 +28,39 @@ def test_load_config(fp_test_config):
     config.load()
 
     assert os.getenv('canary') == 'yellow'
+
+
+def test_dotenv_values_cache(fp_test_config):
+    assert config._dotenv_values(fp_test_config) == {}, 'missing file should yield no config'
+
+    fp_test_config.write_text('canary=yellow')
+    assert config._dotenv_values(fp_test_config) == {'canary': 'yellow'}
+
+    config.config(key='canary', value='green', system=True)
+    assert config._dotenv_values(fp_test_config) == {'canary': 'green'}, (
+        'updating a value should invalidate the cached configuration'
+    )
+
+
+def test_load_full_config(fp_test_config, tmp_path):
+    fp_test_config.write_text("# system config\nfoo='system'\nbar=system # comment\n")
+    fp_local_config = tmp_path / 'local' / config.filename
+    fp_local_config.parent.mkdir()
+    fp_local_config.write_text('\nexport foo="local"\n')
+
+    assert config.load_full_config([fp_test_config, fp_local_config]) == {
+        'foo': 'local',
+        'bar': 'system',
+    }, 'local config should take precedence'
+    assert config.load_full_config([tmp_path / 'missing', None]) == {}, (
+        'missing config files should be ignored'
+    )
+
+
+def test_find_local_config(fp_test_config, tmp_path):
+    assert config.find_local_config() is None, 'should not find config in empty directory'
+
+    config.config(key='canary', value='yellow', system=False)
+    assert config.find_local_config() == tmp_path / config.filename, (
+        'creating a local config should invalidate the cached lookup'
+    )
@@ -1,17 +1,19 @@
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from typing import Callable
 
 import pytest
 from click.testing import Result
 from keyring.errors import PasswordDeleteError
 
+from log_time_to_tempo import __version__, tempo
 from log_time_to_tempo.cli import name
+from log_time_to_tempo.cli.main import _cached_keyring_get, _remove_dir_in_background
 from test_log_time_to_tempo._jira.conftest import TestClient
 
 
 @pytest.fixture
 def mock_tempo(monkeypatch, tmp_path):
-    def no_worklogs(worker_id: str, from_date: date, to_date: date):
+    def no_worklogs(worker_id: str, from_date: date, to_date: date, **kwargs):
         return []
 
     monkeypatch.setattr('log_time_to_tempo.tempo.get_worklogs', no_worklogs)
@@ -47,7 +49,9 @@ def mock_keyring(monkeypatch):
     monkeypatch.setattr('keyring.set_password', _set_password)
     monkeypatch.setattr('keyring.delete_password', _delete_password)
 
+    _cached_keyring_get.cache_clear()
     yield _keyring
+    _cached_keyring_get.cache_clear()
 
 
 @pytest.fixture
@@ -67,6 +71,13 @@ def test_help(log_time, cmd):
     assert not result.stderr
 
 
+def test_version(log_time, mock_keyring):
+    result: Result = log_time(['--version', 'log'])
+    assert result.exit_code == 0
+    assert result.stdout == f'{__version__}\n', 'should only print version'
+    assert not mock_keyring, 'should exit before authenticating'
+
+
 def test_init(log_time):
     result: Result = log_time(['init'], input='12345\n')
     print(result.stdout)
@@ -78,6 +89,33 @@ def test_init(log_time):
     assert not result.stderr, 'should not log any warnings or errors'
 
 
+def test_stats_when_uninitialized(log_time):
+    result: Result = log_time(
+        ['stats', '--from', '1.3.24', '--to', '2.3.24'], env={'JIRA_API_TOKEN': '12345'}
+    )
+    assert result.exit_code == 0
+    assert 'issue cache' not in result.stdout, 'should not update caches it does not need'
+
+
+def test_issues_limit(log_time):
+    result: Result = log_time(
+        ['issues', 'TEST', '--limit', '3'], env={'JIRA_API_TOKEN': '12345', 'LT_CACHE': 'False'}
+    )
+    assert result.exit_code == 0
+    assert 'TEST-3' in result.stdout
+    assert 'TEST-4' not in result.stdout, 'should only list the first three issues'
+    assert result.stdout.splitlines()[-1].startswith('TEST-3\t'), 'piped output should be plain'
+
+
+@pytest.mark.parametrize('cmd', [['issues', 'TEST'], ['projects']])
+def test_negative_limit(log_time, cmd):
+    result: Result = log_time(
+        [*cmd, '--limit', '-1'], env={'JIRA_API_TOKEN': '12345', 'LT_CACHE': 'False'}
+    )
+    assert result.exit_code == 2, 'negative limit should be rejected as usage error'
+    assert 'Invalid value' in result.stderr
+
+
 def test_log_when_uninitialized(log_time):
     result: Result = log_time(['log'], input='12345\n')
 
@@ -116,6 +154,61 @@ def test_log_custom_day(log_time: Callable[[list[str]], Result], day, expected):
     assert expected in confirmation_prompt
 
 
+def test_jira_user_persisted(log_time, monkeypatch, tmp_path):
+    env = {'JIRA_API_TOKEN': '12345', 'LT_CACHE': 'False'}
+    result: Result = log_time(['issues', 'TEST'], env=env)
+    assert result.exit_code == 0
+    assert (tmp_path / '.lt').read_text() == "JIRA_USER='test-user'\n", 'should persist user'
+
+    def fail(*args, **kwargs):
+        raise AssertionError('config should not be written again')
+
+    monkeypatch.setattr('dotenv.set_key', fail)
+    result: Result = log_time(['issues', 'TEST'], env={**env, 'JIRA_USER': 'test-user'})
+    assert result.exit_code == 0, 'known user should not be written to config again'
+
+
+def test_myself_cached_per_token(log_time, monkeypatch):
+    calls = []
+
+    def myself(self):
+        calls.append(self)
+        return dict(name='test-user', key='test-user-key')
+
+    monkeypatch.setattr(TestClient, 'myself', myself)
+    env = {'JIRA_API_TOKEN': '12345', 'LT_CACHE': 'False'}
+    log_time(['issues', 'TEST'], env=env)
+    log_time(['issues', 'TEST'], env=env)
+    assert len(calls) == 1, 'user should be cached for the same token'
+    log_time(['issues', 'TEST'], env={**env, 'JIRA_API_TOKEN': '67890'})
+    assert len(calls) == 2, 'user should be requested again for another token'
+
+
+def test_reset(log_time, tmp_path):
+    cache_dir = tmp_path / 'lt' / 'cache'
+    cache_dir.mkdir(parents=True)
+    (cache_dir / 'issues').write_text('')
+    result: Result = log_time(['reset', '--force'])
+    assert result.exit_code == 0
+    assert 'Cache reset.' in result.stdout
+    assert not cache_dir.exists(), 'cache should have been removed'
+
+
+def test_remove_dir_in_background(tmp_path):
+    cache_dir = tmp_path / 'cache'
+    cache_dir.mkdir()
+    (cache_dir / 'issues').write_text('')
+    leftover = tmp_path / 'cache.deleted-1'
+    leftover.mkdir()
+
+    thread = _remove_dir_in_background(cache_dir)
+    assert not cache_dir.exists(), 'directory should be moved out of the way immediately'
+    thread.join()
+    assert list(tmp_path.iterdir()) == [], 'moved directory and leftovers should be deleted'
+
+    assert _remove_dir_in_background(cache_dir) is None, 'nothing to delete'
+
+
 def test_no_persist_token(log_time, mock_keyring):
     result: Result = log_time(['--no-persist-token'], env=dict(JIRA_API_TOKEN='12345'))
     assert result.exit_code == 0
@@ -126,3 +219,103 @@ def test_no_persist_token(log_time, mock_keyring):
     assert result.exit_code == 0
     assert 'test-user' in mock_keyring[name]
     assert token in mock_keyring[name]['test-user']
+
+
+def test_persist_token_unchanged(log_time, mock_keyring, monkeypatch):
+    env = {'JIRA_API_TOKEN': '12345', 'LT_CACHE': 'False'}
+    result: Result = log_time(['issues', 'TEST'], env=env)
+    assert mock_keyring[name]['test-user'] == '12345'
+
+    def fail(*args, **kwargs):
+        raise AssertionError('token should not be written again')
+
+    monkeypatch.setattr('keyring.set_password', fail)
+    result: Result = log_time(['issues', 'TEST'], env=env)
+    assert result.exit_code == 0, 'stored token should not be written to keyring again'
+
+
+@pytest.fixture
+def mock_worklogs(monkeypatch):
+    def _worklog(key, summary, started, seconds, comment=''):
+        return tempo.Worklog(
+            billableSeconds=seconds,
+            comment=comment,
+            issue=tempo.Issue(id=1, key=key, summary=summary),
+            started=started,
+            originTaskId=1,
+            timeSpent='',
+            timeSpentSeconds=seconds,
+            dateUpdated='',
+            dateCreated='',
+        )
+
+    worklogs = [
+        _worklog('TEST-1', 'Foo', datetime(2024, 3, 1, 9), 3600, 'first'),
+        _worklog('TEST-1', 'Foo', datetime(2024, 3, 1, 10), 1800, 'second'),
+        _worklog('TEST-2', 'Bar', datetime(2024, 3, 2, 9), 4 * 3600),
+    ]
+
+    def get_worklogs(worker_id: str, from_date: date, to_date: date, **kwargs):
+        return worklogs
+
+    monkeypatch.setattr('log_time_to_tempo.tempo.get_worklogs', get_worklogs)
+    return worklogs
+
+
+def test_list(log_time, mock_worklogs):
+    result: Result = log_time(
+        ['list', '--from', '1.3.24', '--to', '2.3.24'],
+        env={'JIRA_API_TOKEN': '12345', 'LT_CACHE': 'False'},
+    )
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert len(lines) == 3, 'should list one worklog per line'
+    assert lines[0].startswith('01.03 09:00')
+    assert lines[0].endswith('Foo (TEST-1) - first')
+    assert lines[2].endswith('Bar (TEST-2) - ')
+
+
+def test_stats(log_time, mock_worklogs):
+    result: Result = log_time(
+        ['stats', '--from', '1.3.24', '--to', '2.3.24'],
+        env={'JIRA_API_TOKEN': '12345', 'LT_CACHE': 'False'},
+    )
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert lines[1].split() == ['4h', 'Bar'], 'projects should be sorted by time spent'
+    assert lines[2].split() == ['1h', '30m', 'Foo'], 'worklogs should be aggregated per project'
+    assert lines[-1].split() == ['5h', '30m', 'Total']
+
+
+@pytest.mark.parametrize('args', [[], ['week']])
+def test_stats_default_range(log_time, mock_worklogs, args):
+    result: Result = log_time(
+        ['stats', *args], env={'JIRA_API_TOKEN': '12345', 'LT_CACHE': 'False'}
+    )
+    assert result.exit_code == 0, 'should default to today as end of range'
+    assert result.stdout.startswith('Period: week')
+
+
+def test_stats_verbose(log_time, mock_worklogs):
+    result: Result = log_time(
+        ['stats', '--from', '1.3.24', '--to', '2.3.24', '-v'],
+        env={'JIRA_API_TOKEN': '12345', 'LT_CACHE': 'False'},
+    )
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert lines[2].split() == ['02.03:', '4h', '-'], 'empty comment'
+    assert lines[4].split() == ['01.03:', '1h', '30m', '-', 'first,', 'second'], (
+        'comments of a day should be joined'
+    )
+
+
+def test_stats_aliased(log_time, mock_worklogs, tmp_path):
+    (tmp_path / 'aliases').write_text('{"TEST-1": "Baz", "TEST-2": "Baz"}')
+    result: Result = log_time(
+        ['stats', '--from', '1.3.24', '--to', '2.3.24'],
+        env={'JIRA_API_TOKEN': '12345', 'LT_CACHE': 'False'},
+    )
+    assert result.exit_code == 0
+    assert result.stdout.splitlines()[1].split() == ['5h', '30m', 'Baz'], (
+        'worklogs should be aggregated by alias'
+    )
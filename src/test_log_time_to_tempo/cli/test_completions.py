@@ -0,0 +1,52 @@
+import pytest
+
+import log_time_to_tempo._jira as _jira
+from log_time_to_tempo.cli import completions
+from test_log_time_to_tempo._jira.conftest import TestClient
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    monkeypatch.setattr('log_time_to_tempo.caching.cache_dir', cache_dir)
+    return cache_dir
+
+
+def test_complete_project_without_cache(cache_dir):
+    items = completions.complete_project(None, 'project', '')
+    assert [item.value for item in items] == ['TSI'], 'should fall back to default project'
+
+
+def test_complete_project_updates_with_cache(cache_dir):
+    assert [item.value for item in completions.complete_project(None, 'project', '')] == ['TSI']
+
+    _jira.get_projects(TestClient())
+    items = completions.complete_project(None, 'project', '')
+    assert [item.value for item in items] == ['TEST', 'ZEST'], 'should pick up updated cache'
+
+    items = completions.complete_project(None, 'project', 'zest')
+    assert [item.value for item in items] == ['ZEST'], 'should match project name'
+
+
+def test_complete_issue(monkeypatch, cache_dir):
+    _jira.get_all_issues(TestClient())
+
+    items = completions.complete_issue(None, 'issue', 'zest-1')
+    assert [item.value for item in items] == ['ZEST-1'] + [f'ZEST-{n}' for n in range(10, 20)], (
+        'should only complete issues matching the prefix'
+    )
+
+    monkeypatch.setattr('log_time_to_tempo.cli.completions.max_completions', 5)
+    assert len(completions.complete_issue(None, 'issue', '')) == 5, 'should limit completions'
+
+
+def test_complete_date_range():
+    items = completions.complete_date_range(None, 'date_range', 'last_')
+    assert [item.value for item in items] == [
+        'last_7_days',
+        'last_30_days',
+        'last_week',
+        'last_month',
+        'last_year',
+    ]
+    assert len(completions.complete_date_range(None, 'date_range', '')) == 10
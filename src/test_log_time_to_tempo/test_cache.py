@@ -102,3 +102,33 @@ def test_invalidate_all(mock):
     )
     caching.invalidate()
     assert not caching.get_caches_for(hello)
+
+
+def test_cache_max_age(mock):
+    "The maximum age of a cached result can depend on the arguments of the call."
+    calls = []
+
+    @caching.cache('greet-$greeting-$name', days=lambda args: None if args['name'] else 0)
+    def greet(greeting, name='', **kwargs):
+        calls.append(name)
+        return f'{greeting}, {name}!'
+
+    greet('Hi', 'alice')
+    assert mock.load_cache('greet-Hi-alice') == 'Hi, alice!', 'arguments should appear in name'
+    greet('Hi', 'alice')
+    assert calls == ['alice'], 'result should never expire'
+    greet('Hi')
+    greet('Hi')
+    assert calls == ['alice', '', ''], 'result should expire immediately'
+
+
+def test_invalidate_matching(mock):
+    "Cached results of a function should be deleted, even if cached by another process."
+    hello('foo')
+    hello('bar')
+    (mock.cache_dir / 'hello').write_text('')
+    caching._registry.clear()
+    caching.invalidate_matching(hello)
+    assert sorted(fp.name for fp in mock.cache_dir.iterdir()) == ['hello'], (
+        'only files matching the filename template should be deleted'
+    )
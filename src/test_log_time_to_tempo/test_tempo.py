@@ -0,0 +1,74 @@
+import json
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+
+import log_time_to_tempo.tempo as tempo
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    monkeypatch.setattr('log_time_to_tempo.caching.cache_dir', cache_dir)
+    return cache_dir
+
+
+def test_get_worklogs(monkeypatch):
+    worklog = {
+        'billableSeconds': 3600,
+        'comment': 'foo',
+        'issue': {'id': 1, 'key': 'TEST-1', 'summary': 'Test issue', 'projectKey': 'TEST'},
+        'started': '2024-03-01 09:00:00.000',
+        'originTaskId': 1,
+        'timeSpent': '1h',
+        'timeSpentSeconds': 3600,
+        'dateUpdated': '',
+        'dateCreated': '',
+    }
+
+    def _post(endpoint='', **kwargs):
+        requests.append(kwargs['json'])
+        return SimpleNamespace(text='', content=json.dumps([worklog, worklog]).encode())
+
+    requests = []
+    monkeypatch.setattr('log_time_to_tempo.tempo._post', _post)
+
+    worklogs = tempo.get_worklogs('test-user', date(2024, 3, 1), date(2024, 3, 1))
+    assert len(worklogs) == 2
+    assert worklogs[0].issue.key == 'TEST-1'
+    assert worklogs[0].started == datetime(2024, 3, 1, 9), 'started should be parsed'
+    assert len(requests) == 1
+
+    assert tempo.get_worklogs('test-user', date(2024, 3, 1), date(2024, 3, 1)) == worklogs
+    assert len(requests) == 1, 'worklogs of past periods should be cached'
+    tempo.get_worklogs('test-user', date(2024, 3, 1), date(2024, 3, 1), update_cache=True)
+    assert len(requests) == 2, 'update_cache should fetch worklogs again'
+
+    tempo.create_worklog('test-user', 'TEST-1', '2024-03-01T10:00:00.000', 3600)
+    tempo.get_worklogs('test-user', date(2024, 3, 1), date(2024, 3, 1))
+    assert len(requests) == 4, 'creating a worklog should invalidate cached worklogs'
+
+
+def test_get_worklogs_parallel(monkeypatch):
+    requested = []
+
+    def _search_worklogs(worker_id, from_date, to_date):
+        requested.append((from_date, to_date))
+        return [from_date]
+
+    monkeypatch.setattr('log_time_to_tempo.tempo._search_worklogs', _search_worklogs)
+
+    worklogs = tempo.get_worklogs(
+        'test-user', date(2023, 12, 15), date(2024, 2, 10), parallel=4, no_cache=True
+    )
+    assert worklogs == [date(2023, 12, 15), date(2024, 1, 1), date(2024, 2, 1)], 'order is kept'
+    assert sorted(requested) == [
+        (date(2023, 12, 15), date(2023, 12, 31)),
+        (date(2024, 1, 1), date(2024, 1, 31)),
+        (date(2024, 2, 1), date(2024, 2, 10)),
+    ]
+
+    requested.clear()
+    tempo.get_worklogs('test-user', date(2023, 12, 15), date(2024, 2, 10), no_cache=True)
+    assert requested == [(date(2023, 12, 15), date(2024, 2, 10))], 'single request by default'
@@ -107,6 +107,19 @@ def test_last_monday(day):
     assert day - last_monday < timedelta(weeks=1)
 
 
+@pytest.mark.parametrize(
+    'given,expected',
+    [
+        ('week', _time.RelativeDateRange.WEEK),
+        ('w', _time.RelativeDateRange.WEEK),
+        ('l30', _time.RelativeDateRange.LAST_30_DAYS),
+        (_time.RelativeDateRange.MONTH, _time.RelativeDateRange.MONTH),
+    ],
+)
+def test_resolve_relative_date_range(given, expected):
+    assert _time.resolve_relative_date_range(given) == expected
+
+
 def test_parse_relative_date_range():
     # ranges that cover a single day
     for rng in [_time.RelativeDateRange.TODAY, _time.RelativeDateRange.YESTERDAY]: